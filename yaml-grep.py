@@ -16,25 +16,150 @@ Options:
   --path-format {pointer,dot}   Output path style (default: pointer).
   --color {auto,always,never}   Colorize matches (default: auto).
   --max-matches N    Stop after N total matches (0 = unlimited).
+  --engine {re,re2}  Regex engine (default: re). See "Regex engine" below.
+  --jobs N           Worker processes for a top-level list of at least 1024
+                     items (default: CPU count; 1 = no workers). Needs fork().
+                     Matches of up to 2*N list ranges are held in memory
+                     while earlier ranges are written, to keep their order.
+  --stream           Match while parsing instead of loading the whole document
+                     first. JSON (.json) streaming requires ijson
+                     (pip install ijson), which rejects NaN/Infinity,
+                     integers wider than 64 bits and out-of-range floats
+                     (drop --stream for those). YAML aliases are not expanded
+                     and merge keys (<<) are reported as plain keys. Input that
+                     is not valid UTF-8 is rejected instead of being decoded
+                     with replacement characters.
 
 File:
   FILE is a path or "-" for stdin. YAML requires PyYAML (pip install pyyaml).
-  JSON is supported with the standard library.
+  JSON is supported with the standard library (orjson is used if installed).
+
+Regex engine:
+  --engine re2 runs patterns on RE2 (pip install google-re2), which matches
+  in linear time (no catastrophic backtracking) but is not faster for
+  typical keys/values. RE2 syntax differs from Python's re: \w, \d, \s
+  and \b are ASCII-only, and $ matches only at the very end of the string,
+  not before a trailing newline. Patterns RE2 cannot express
+  (backreferences, lookaround, \Z) fall back to Python's re, with a
+  warning on stderr since they lose the linear-time guarantee.
 """
 
 from __future__ import annotations
 import argparse
+import itertools
 import json
+import mmap
+import multiprocessing
 import os
 import re
 import sys
-from typing import Any, Iterable, List, Tuple, Union
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Union
 
 try:
     import yaml  # type: ignore
     HAVE_YAML = True
+    # libyaml-backed loader when PyYAML was built with it
+    try:
+        from yaml import CSafeLoader as _YLoader  # type: ignore
+    except ImportError:
+        from yaml import SafeLoader as _YLoader  # type: ignore
+    DECODE_ERRORS: Tuple[type, ...] = (UnicodeDecodeError, yaml.reader.ReaderError)
 except Exception:
     HAVE_YAML = False
+    DECODE_ERRORS = (UnicodeDecodeError,)
+
+try:
+    import ijson  # type: ignore
+    HAVE_IJSON = True
+except Exception:
+    HAVE_IJSON = False
+
+try:
+    import re2  # type: ignore  # google-re2
+    # pyre2 also imports as re2 but has another API; treat it as missing
+    HAVE_RE2 = hasattr(re2, "Options")
+except Exception:
+    HAVE_RE2 = False
+
+try:
+    import orjson  # type: ignore
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
+
+# orjson turns integers beyond 64 bits into floats instead of failing; any
+# run of 19+ digits might be one, so such documents go to the stdlib
+_LONG_DIGITS_RE = re.compile(rb"[0-9]{19}")
+
+
+def json_loads(data: Any) -> Any:
+    # `data` is str, bytes or an mmap; neither parser takes an mmap as-is
+    plain = isinstance(data, (str, bytes))
+    if HAVE_ORJSON and not isinstance(data, str) and not _LONG_DIGITS_RE.search(data):
+        try:
+            if plain:
+                return orjson.loads(data)
+            with memoryview(data) as view:
+                return orjson.loads(view)
+        except orjson.JSONDecodeError:
+            # stdlib is laxer (NaN/Infinity)
+            pass
+    return json.loads(data if plain else bytes(data))
+
+
+def json_dumps(x: Any) -> str:
+    if HAVE_ORJSON:
+        try:
+            return orjson.dumps(x).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(x, ensure_ascii=False)
+
+
+def compile_pattern(pattern: str, flags: int, engine: str = "re") -> Any:
+    if engine == "re2":
+        opts = re2.Options()
+        opts.log_errors = False
+        opts.case_sensitive = not flags & re.IGNORECASE
+        try:
+            return re2.compile(pattern, opts)
+        except re2.error:
+            # Not RE2 syntax (e.g. backreference) or invalid; re decides which.
+            # Falling back drops RE2's linear-time guarantee, so say so.
+            rx = re.compile(pattern, flags)
+            print(f"WARNING: pattern {pattern!r} not supported by RE2; using re",
+                  file=sys.stderr)
+            return rx
+    return re.compile(pattern, flags)
+
+
+def any_pattern(
+    patterns: List[str], regexes: List[Any], flags: int, engine: str = "re"
+) -> Callable[[str], Any]:
+    """Return a search(s) callable that matches when any of the patterns does."""
+    if len(regexes) == 1:
+        return regexes[0].search
+    # One alternation so each key/value costs a single search() call. Only
+    # safe without groups: numbering and names would clash across patterns.
+    # Under RE2, a pattern that fell back to re keeps the others on RE2.
+    if all(rx.groups == 0 for rx in regexes) and not (
+        engine == "re2" and any(isinstance(rx, re.Pattern) for rx in regexes)
+    ):
+        try:
+            return compile_pattern("|".join(f"(?:{p})" for p in patterns), flags, engine).search
+        except re.error:
+            pass  # e.g. an inline (?i), which is only valid at the very start
+
+    def search_any(s: str) -> Any:
+        for rx in regexes:
+            m = rx.search(s)
+            if m:
+                return m
+        return None
+    return search_any
 
 
 def parse_args() -> argparse.Namespace:
@@ -54,6 +179,13 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--color", choices=["auto", "always", "never"], default="auto",
                    help="Colorize matches")
     p.add_argument("--max-matches", type=int, default=0, help="Stop after N matches (0 = unlimited)")
+    p.add_argument("--engine", choices=["re", "re2"], default="re",
+                   help="Regex engine; re2 needs google-re2 (default: re)")
+    p.add_argument("--jobs", type=int, default=0,
+                   help="Worker processes for large top-level lists (0 = CPU count); "
+                        "matches of up to 2*N ranges are buffered")
+    p.add_argument("--stream", action="store_true",
+                   help="Match while parsing instead of loading the whole document")
     p.add_argument("rest", nargs="*", help="[PATTERN ...] -- FILE  (or use -e)")
     return p.parse_args()
 
@@ -79,51 +211,161 @@ def split_patterns_and_file(rest: List[str], existing_patterns: List[str] | None
             sys.exit("ERROR: Missing FILE after '--'")
         patterns += pats
         return (patterns, file_)
-    # If more than one arg and last one looks like a file, treat others as patterns
-    if len(rest) >= 2 and (os.path.exists(rest[-1]) or rest[-1] == "-"):
-        patterns += rest[:-1]
-        return (patterns, rest[-1])
     # Only one thing: ambiguous
     if len(rest) == 1:
         sys.exit("ERROR: Provide FILE (or '-') and at least one PATTERN (or -e).")
-    # Fallback: assume last is file
+    # Last is the file, the others are patterns. Not stat()ed here: it would be
+    # taken as FILE whether or not it exists.
     patterns += rest[:-1]
     return (patterns, rest[-1])
 
 
+MMAP_MIN_SIZE = 1 << 20  # files at least this big are parsed from an mmap
+
+
 def load_data(path: str) -> Any:
-    data_bytes = sys.stdin.buffer.read() if path == "-" else open(path, "rb").read()
-    text = data_bytes.decode("utf-8", errors="replace")
+    if path != "-" and os.path.getsize(path) >= MMAP_MIN_SIZE:
+        # Parse straight from the page cache instead of a private bytes copy
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            try:
+                return parse_data(mm, path)
+            except DECODE_ERRORS:
+                return parse_data(mm[:].decode("utf-8", errors="replace"), path)
+    # Both parsers take bytes directly; skip building a decoded str copy
+    data = sys.stdin.buffer.read() if path == "-" else Path(path).read_bytes()
+    try:
+        return parse_data(data, path)
+    except DECODE_ERRORS:
+        # Not valid UTF-8: search a lossy decode (U+FFFD for bad bytes)
+        return parse_data(data.decode("utf-8", errors="replace"), path)
+
+
+def parse_data(data: Any, path: str) -> Any:
+    """Parse `data` (bytes, str, or an mmap of the file) as YAML/JSON based on `path`."""
     # Decide by extension first
     ext = os.path.splitext(path)[1].lower()
     if ext in (".yaml", ".yml") or (ext == "" and HAVE_YAML):
         if not HAVE_YAML:
             sys.exit("ERROR: PyYAML not installed. Install with: pip install pyyaml")
-        return yaml.safe_load(text)
+        return yaml.load(data, Loader=_YLoader)
     if ext == ".json":
-        return json.loads(text)
+        return json_loads(data)
     # Try JSON, then YAML
     try:
-        return json.loads(text)
+        return json_loads(data)
     except Exception:
         if not HAVE_YAML:
             sys.exit("ERROR: Could not parse as JSON. For YAML support: pip install pyyaml")
-        return yaml.safe_load(text)
+        return yaml.load(data, Loader=_YLoader)
+
+
+# Event kinds produced by load_events()
+EV_MAP, EV_SEQ, EV_END, EV_SCALAR, EV_ALIAS = range(5)
+
+
+def _json_events(f: Any) -> Iterator[Tuple[int, Any]]:
+    try:
+        for _prefix, event, value in ijson.parse(f, use_float=True):
+            if event == "start_map":
+                yield (EV_MAP, None)
+            elif event == "start_array":
+                yield (EV_SEQ, None)
+            elif event in ("end_map", "end_array"):
+                yield (EV_END, None)
+            else:  # map_key or a scalar
+                yield (EV_SCALAR, value)
+    except ijson.JSONError as e:
+        sys.exit(f"ERROR: Could not stream-parse JSON (try without --stream): {e}")
+
+
+def _yaml_events(f: Any) -> Iterator[Tuple[int, Any]]:
+    loader = _YLoader(f)
+    try:
+        while loader.check_event():
+            ev = loader.get_event()
+            if isinstance(ev, yaml.ScalarEvent):
+                # Resolve and construct the scalar the same way safe loading does
+                tag = ev.tag
+                if tag is None or tag == "!":
+                    tag = loader.resolve(yaml.ScalarNode, ev.value, ev.implicit)
+                construct = loader.yaml_constructors.get(tag)
+                if construct is None:
+                    yield (EV_SCALAR, ev.value)
+                else:
+                    node = yaml.ScalarNode(tag, ev.value, ev.start_mark, ev.end_mark, ev.style)
+                    yield (EV_SCALAR, construct(loader, node))
+            elif isinstance(ev, yaml.MappingStartEvent):
+                yield (EV_MAP, None)
+            elif isinstance(ev, yaml.SequenceStartEvent):
+                yield (EV_SEQ, None)
+            elif isinstance(ev, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                yield (EV_END, None)
+            elif isinstance(ev, yaml.AliasEvent):
+                yield (EV_ALIAS, None)
+    except DECODE_ERRORS as e:
+        # load_data() retries on a lossy decode; a half-read stream can't
+        sys.exit(f"ERROR: Could not stream-parse YAML, not UTF-8 (try without --stream): {e}")
+    finally:
+        loader.dispose()
+
+
+def load_events(path: str) -> Iterator[Tuple[int, Any]]:
+    """Parse incrementally, yielding (kind, value) events for search_events()."""
+    f = sys.stdin.buffer if path == "-" else open(path, "rb")
+    try:
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".json" or not HAVE_YAML:
+            if not HAVE_IJSON:
+                sys.exit("ERROR: --stream for JSON needs ijson. Install with: pip install ijson")
+            yield from _json_events(f)
+        else:
+            yield from _yaml_events(f)
+    finally:
+        if f is not sys.stdin.buffer:
+            f.close()
+
+
+_INF = float("inf")
+
+
+# The parsers only produce these exact types, so subclasses need no handling
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
 
 
 def is_scalar(x: Any) -> bool:
-    return isinstance(x, (str, int, float, bool)) or x is None
+    return type(x) in _SCALAR_TYPES
 
 
 def stringify(x: Any) -> str:
-    if isinstance(x, str):
+    # Exact type checks for the common scalars; same text json.dumps gives
+    t = type(x)
+    if t is str:
         return x
-    return json.dumps(x, ensure_ascii=False)
+    if t is bool:
+        return "true" if x else "false"
+    if t is int:
+        return repr(x)
+    if x is None:
+        return "null"
+    if t is float:
+        if x != x:
+            return "NaN"
+        if x == _INF:
+            return "Infinity"
+        if x == -_INF:
+            return "-Infinity"
+        return repr(x)
+    return json_dumps(x)
+
+
+_JP_TABLE = str.maketrans({"~": "~0", "/": "~1"})
 
 
 def json_pointer_escape(token: str) -> str:
-    # RFC 6901 escape: "~" -> "~0", "/" -> "~1"
-    return token.replace("~", "~0").replace("/", "~1")
+    # RFC 6901 escape: "~" -> "~0", "/" -> "~1"; most keys need neither
+    if "~" not in token and "/" not in token:
+        return token
+    return token.translate(_JP_TABLE)
 
 
 def to_path_pointer(tokens: List[Union[str, int]]) -> str:
@@ -136,6 +378,9 @@ def to_path_pointer(tokens: List[Union[str, int]]) -> str:
     return "/" + "/".join(parts)
 
 
+_IDENT_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
 def to_path_dot(tokens: List[Union[str, int]]) -> str:
     out = "root"
     for t in tokens:
@@ -143,22 +388,45 @@ def to_path_dot(tokens: List[Union[str, int]]) -> str:
             out += f"[{t}]"
         else:
             # simple identifier?
-            if re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", t):
+            if _IDENT_RE.fullmatch(t):
                 out += f".{t}"
             else:
                 out += f"[{json.dumps(t)}]"  # quoted key
     return out
 
 
+MATCH_CACHE_SIZE = 100_000  # distinct strings remembered per search
+MATCH_CACHE_MAX_LEN = 64  # longer strings are rarely repeated; search them directly
+
+
+def cached_search(rx_search: Callable[[str], Any]) -> Callable[[str], bool]:
+    """Wrap rx_search so repeated keys/values (same key in every list item,
+    etc.) are only searched once per walk."""
+    seen: Dict[str, bool] = {}
+    seen_get = seen.get
+
+    def matches(s: str) -> bool:
+        if len(s) > MATCH_CACHE_MAX_LEN:
+            return rx_search(s) is not None
+        hit = seen_get(s)
+        if hit is None:
+            hit = rx_search(s) is not None
+            if len(seen) < MATCH_CACHE_SIZE:
+                seen[s] = hit
+        return hit
+    return matches
+
+
 def colorize(s: str, regexes: List[re.Pattern], enabled: bool) -> str:
     if not enabled:
         return s
     # apply all patterns; wrap matches in ANSI bold
-    # To avoid nested escapes, use a single pass that merges ranges
+    # To avoid nested escapes, use a single pass that merges ranges.
+    # Patterns run separately (not as the combined alternation) so overlapping
+    # matches from different patterns are all highlighted.
     ranges: List[Tuple[int, int]] = []
     for rx in regexes:
-        for m in rx.finditer(s):
-            ranges.append((m.start(), m.end()))
+        ranges.extend(m.span() for m in rx.finditer(s))
     if not ranges:
         return s
     # merge overlapping ranges
@@ -188,64 +456,227 @@ def colorize(s: str, regexes: List[re.Pattern], enabled: bool) -> str:
 def search(
     obj: Any,
     tokens: List[Union[str, int]],
+    rx_search: Callable[[str], Any],
     regexes: List[re.Pattern],
     match_keys: bool,
     match_values: bool,
     path_fmt: str,
     color: bool,
     max_matches: int,
-    out: List[str],
-) -> None:
-    if max_matches and len(out) >= max_matches:
-        return
+    write: Callable[[str], Any],
+    start: int = 0,
+) -> int:
+    """Write matching lines through `write` as they are found; return the count.
 
-    # Dict
+    `start` is the index of obj[0] when obj is a slice of a larger root list.
+    """
+    # Hot loop: bind lookups to locals once
+    matches = cached_search(rx_search)
+    _is_scalar = is_scalar
+    _stringify = stringify
+    ptr_mode = path_fmt == "pointer"
+    to_path = to_path_pointer if ptr_mode else to_path_dot
+
+    # Scalar at root (rare)
+    if not isinstance(obj, (dict, list)):
+        if match_values and _is_scalar(obj):
+            s = _stringify(obj)
+            if rx_search(s):
+                path = "" if ptr_mode else "root"
+                shown = colorize(s, regexes, True) if color else s
+                write(f"{path}\t(VAL)\t{shown}\n")
+                return 1
+        return 0
+
+    # Explicit DFS stack instead of recursion, so deep documents don't pay
+    # for Python frames. Each entry is (items iterator, check_keys); descending
+    # into a child suspends the parent's iterator, which keeps the output in
+    # document order. check_keys folds "is a dict" and match_keys into one
+    # flag per level, so the per-item loop tests a single local. `tokens` is
+    # shared and mutated in place (one push per level entered, one pop per
+    # level left); paths are only built on a hit.
     if isinstance(obj, dict):
-        for k, v in obj.items():
+        stack = [(iter(obj.items()), match_keys)]
+    else:
+        stack = [(enumerate(obj, start), False)]
+    push = tokens.append
+    pop = tokens.pop
+    count = 0
+    while stack:
+        items, check_keys = stack[-1]
+        for k, v in items:
+            path = None
             # Keys
-            if match_keys:
-                ks = stringify(k)
-                if any(rx.search(ks) for rx in regexes):
-                    path = to_path_pointer(tokens + [k]) if path_fmt == "pointer" else to_path_dot(tokens + [k])
-                    shown = colorize(ks, regexes, color)
-                    out.append(f"{path}\t(KEY)\t{shown}")
-                    if max_matches and len(out) >= max_matches:
-                        return
+            if check_keys:
+                ks = _stringify(k)
+                if matches(ks):
+                    push(k)
+                    path = to_path(tokens)
+                    pop()
+                    shown = colorize(ks, regexes, True) if color else ks
+                    write(f"{path}\t(KEY)\t{shown}\n")
+                    count += 1
+                    if max_matches and count >= max_matches:
+                        return count
             # Values (for scalars)
-            if match_values and is_scalar(v):
-                vs = stringify(v)
-                if any(rx.search(vs) for rx in regexes):
-                    path = to_path_pointer(tokens + [k]) if path_fmt == "pointer" else to_path_dot(tokens + [k])
-                    shown = colorize(vs, regexes, color)
-                    out.append(f"{path}\t(VAL)\t{shown}")
-                    if max_matches and len(out) >= max_matches:
-                        return
-            # Recurse
-            if isinstance(v, (dict, list)):
-                search(v, tokens + [k], regexes, match_keys, match_values, path_fmt, color, max_matches, out)
-
-    # List
-    elif isinstance(obj, list):
-        for idx, v in enumerate(obj):
-            if match_values and is_scalar(v):
-                vs = stringify(v)
-                if any(rx.search(vs) for rx in regexes):
-                    path = to_path_pointer(tokens + [idx]) if path_fmt == "pointer" else to_path_dot(tokens + [idx])
-                    shown = colorize(vs, regexes, color)
-                    out.append(f"{path}\t(VAL)\t{shown}")
-                    if max_matches and len(out) >= max_matches:
-                        return
-            if isinstance(v, (dict, list)):
-                search(v, tokens + [idx], regexes, match_keys, match_values, path_fmt, color, max_matches, out)
+            if match_values and _is_scalar(v):
+                vs = _stringify(v)
+                if matches(vs):
+                    if path is None:  # not already built for the key
+                        push(k)
+                        path = to_path(tokens)
+                        pop()
+                    shown = colorize(vs, regexes, True) if color else vs
+                    write(f"{path}\t(VAL)\t{shown}\n")
+                    count += 1
+                    if max_matches and count >= max_matches:
+                        return count
+            # Descend
+            if isinstance(v, dict):
+                push(k)
+                stack.append((iter(v.items()), match_keys))
+                break
+            if isinstance(v, list):
+                push(k)
+                stack.append((enumerate(v), False))
+                break
+        else:
+            stack.pop()
+            if stack:
+                pop()
+    return count
+
+
+PARALLEL_MIN_ITEMS = 1024  # root lists shorter than this are searched in-process
+
+_worker_data: List[Any] = []
+_worker_options: Dict[str, Any] = {}
+
+
+def _init_worker(data: List[Any], options: Dict[str, Any]) -> None:
+    # Runs in the forked child; arguments are inherited, not pickled
+    global _worker_data, _worker_options
+    _worker_data = data
+    _worker_options = options
 
-    # Scalar at root (rare)
-    else:
-        if match_values and is_scalar(obj):
-            s = stringify(obj)
-            if any(rx.search(s) for rx in regexes):
-                path = "" if path_fmt == "pointer" else "root"
-                shown = colorize(s, regexes, color)
-                out.append(f"{path}\t(VAL)\t{shown}")
+
+def _search_slice(bounds: Tuple[int, int]) -> List[str]:
+    lo, hi = bounds
+    lines: List[str] = []
+    search(_worker_data[lo:hi], tokens=[], write=lines.append, start=lo, **_worker_options)
+    return lines
+
+
+def search_parallel(
+    data: List[Any],
+    jobs: int,
+    write: Callable[[str], Any],
+    **options: Any,
+) -> int:
+    """search() a root list in `jobs` forked workers, one index range at a time.
+
+    Results are written in document order; each range honours max_matches on
+    its own and the total is cut off here. At most 2 * jobs ranges are in
+    flight, so finished-but-unwritten results stay bounded.
+    """
+    max_matches = options["max_matches"]
+    step = max(256, -(-len(data) // (jobs * 4)))
+    bounds = [(lo, min(lo + step, len(data))) for lo in range(0, len(data), step)]
+    jobs = min(jobs, len(bounds))
+    todo = iter(bounds)
+    count = 0
+    ctx = multiprocessing.get_context("fork")
+    with ctx.Pool(jobs, initializer=_init_worker, initargs=(data, options)) as pool:
+        pending = deque(pool.apply_async(_search_slice, (b,))
+                        for b in itertools.islice(todo, 2 * jobs))
+        while pending:
+            lines = pending.popleft().get()
+            nxt = next(todo, None)
+            if nxt is not None:
+                pending.append(pool.apply_async(_search_slice, (nxt,)))
+            for line in lines:
+                write(line)
+                count += 1
+                if max_matches and count >= max_matches:
+                    return count
+    return count
+
+
+def search_events(
+    events: Iterable[Tuple[int, Any]],
+    rx_search: Callable[[str], Any],
+    regexes: List[re.Pattern],
+    match_keys: bool,
+    match_values: bool,
+    path_fmt: str,
+    color: bool,
+    max_matches: int,
+    write: Callable[[str], Any],
+) -> int:
+    """Like search(), but over a parse event stream; memory is O(depth)."""
+    # No match cache here: it would keep strings alive and break O(depth)
+    _is_scalar = is_scalar
+    _stringify = stringify
+    ptr_mode = path_fmt == "pointer"
+    to_path = to_path_pointer if ptr_mode else to_path_dot
+    root_path = "" if ptr_mode else "root"
+
+    # One [is_dict, want_key, next_index] per open container. `tokens` holds
+    # the path to the value currently being read.
+    frames: List[list] = []
+    tokens: List[Union[str, int]] = []
+    push = tokens.append
+    pop = tokens.pop
+    count = 0
+    for kind, value in events:
+        if kind == EV_END:
+            frames.pop()
+            if frames:  # the container was its parent's value
+                pop()
+                frames[-1][1] = frames[-1][0]
+            continue
+        frame = frames[-1] if frames else None
+        # Key position in a mapping
+        if frame is not None and frame[1]:
+            if kind != EV_SCALAR:
+                sys.exit("ERROR: --stream does not support non-scalar mapping keys")
+            if match_keys:
+                ks = _stringify(value)
+                if rx_search(ks):
+                    push(value)
+                    path = to_path(tokens)
+                    pop()
+                    shown = colorize(ks, regexes, True) if color else ks
+                    write(f"{path}\t(KEY)\t{shown}\n")
+                    count += 1
+                    if max_matches and count >= max_matches:
+                        return count
+            push(value)
+            frame[1] = False
+            continue
+        # A value: in a list it takes the next index
+        if frame is not None and not frame[0]:
+            push(frame[2])
+            frame[2] += 1
+        if kind == EV_MAP:
+            frames.append([True, True, 0])
+            continue
+        if kind == EV_SEQ:
+            frames.append([False, False, 0])
+            continue
+        if kind == EV_SCALAR and match_values and _is_scalar(value):
+            vs = _stringify(value)
+            if rx_search(vs):
+                path = to_path(tokens) if frame is not None else root_path
+                shown = colorize(vs, regexes, True) if color else vs
+                write(f"{path}\t(VAL)\t{shown}\n")
+                count += 1
+                if max_matches and count >= max_matches:
+                    return count
+        if frame is not None:
+            pop()
+            frame[1] = frame[0]
+    return count
 
 
 def main() -> None:
@@ -254,13 +685,13 @@ def main() -> None:
     if not patterns:
         sys.exit("ERROR: No patterns provided.")
     flags = re.IGNORECASE if args.ignore_case else 0
+    if args.engine == "re2" and not HAVE_RE2:
+        sys.exit("ERROR: --engine re2 needs google-re2. Install with: pip install google-re2")
     try:
-        regexes = [re.compile(p, flags) for p in patterns]
+        regexes = [compile_pattern(p, flags, args.engine) for p in patterns]
     except re.error as e:
         sys.exit(f"ERROR: invalid regex: {e}")
 
-    data = load_data(file_)
-
     # Determine color
     if args.color == "always":
         use_color = True
@@ -276,24 +707,36 @@ def main() -> None:
     if args.values_only:
         match_keys = False
 
-    out: List[str] = []
-    search(
-        data,
-        tokens=[],  # root
+    options = dict(
+        rx_search=any_pattern(patterns, regexes, flags, args.engine),
         regexes=regexes,
         match_keys=match_keys,
         match_values=match_values,
         path_fmt=args.path_format,
         color=use_color,
         max_matches=args.max_matches,
-        out=out,
     )
-
-    for line in out:
-        print(line)
+    # Matches stream straight to stdout (buffered) rather than being collected
+    try:
+        if args.stream:
+            count = search_events(load_events(file_), write=sys.stdout.write, **options)
+        else:
+            data = load_data(file_)
+            jobs = args.jobs or os.cpu_count() or 1
+            if (jobs > 1 and isinstance(data, list) and len(data) >= PARALLEL_MIN_ITEMS
+                    and "fork" in multiprocessing.get_all_start_methods()):
+                sys.stdout.flush()  # don't let workers inherit pending output
+                count = search_parallel(data, jobs, write=sys.stdout.write, **options)
+            else:
+                count = search(data, tokens=[], write=sys.stdout.write, **options)  # root
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Reader went away (e.g. piped into head); stop quietly like grep
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(0)
 
     # Exit code similar to grep: 0 if matches, 1 if none
-    sys.exit(0 if out else 1)
+    sys.exit(0 if count else 1)
 
 
 if __name__ == "__main__":
@@ -20,36 +20,91 @@ Notes:
 from __future__ import annotations
 import argparse
 import json
+import mmap
 import os
+import re
 import sys
-from typing import Any, List, Union
+from pathlib import Path
+from typing import Any, List, Tuple, Union
 
 try:
     import yaml  # type: ignore
     HAVE_YAML = True
+    # libyaml-backed loader when PyYAML was built with it
+    try:
+        from yaml import CSafeLoader as _YLoader  # type: ignore
+    except ImportError:
+        from yaml import SafeLoader as _YLoader  # type: ignore
+    DECODE_ERRORS: Tuple[type, ...] = (UnicodeDecodeError, yaml.reader.ReaderError)
 except Exception:
     HAVE_YAML = False
+    DECODE_ERRORS = (UnicodeDecodeError,)
+
+try:
+    import orjson  # type: ignore
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
+
+# orjson turns integers beyond 64 bits into floats instead of failing; any
+# run of 19+ digits might be one, so such documents go to the stdlib
+_LONG_DIGITS_RE = re.compile(rb"[0-9]{19}")
+
+
+def json_loads(data: Any) -> Any:
+    # `data` is str, bytes or an mmap; neither parser takes an mmap as-is
+    plain = isinstance(data, (str, bytes))
+    if HAVE_ORJSON and not isinstance(data, str) and not _LONG_DIGITS_RE.search(data):
+        try:
+            if plain:
+                return orjson.loads(data)
+            with memoryview(data) as view:
+                return orjson.loads(view)
+        except orjson.JSONDecodeError:
+            # stdlib is laxer (NaN/Infinity)
+            pass
+    return json.loads(data if plain else bytes(data))
+
+
+MMAP_MIN_SIZE = 1 << 20  # files at least this big are parsed from an mmap
 
 
 def load_data(path: str) -> Any:
-    data_bytes = sys.stdin.buffer.read() if path == "-" else open(path, "rb").read()
-    text = data_bytes.decode("utf-8", errors="replace")
+    if path != "-" and os.path.getsize(path) >= MMAP_MIN_SIZE:
+        # Parse straight from the page cache instead of a private bytes copy
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            try:
+                return parse_data(mm, path)
+            except DECODE_ERRORS:
+                return parse_data(mm[:].decode("utf-8", errors="replace"), path)
+    # Both parsers take bytes directly; skip building a decoded str copy
+    data = sys.stdin.buffer.read() if path == "-" else Path(path).read_bytes()
+    try:
+        return parse_data(data, path)
+    except DECODE_ERRORS:
+        # Not valid UTF-8: search a lossy decode (U+FFFD for bad bytes)
+        return parse_data(data.decode("utf-8", errors="replace"), path)
+
+
+def parse_data(data: Any, path: str) -> Any:
+    """Parse `data` (bytes, str, or an mmap of the file) as YAML/JSON based on `path`."""
     ext = os.path.splitext(path)[1].lower()
 
     if ext in (".yaml", ".yml") or (ext == "" and HAVE_YAML):
         if not HAVE_YAML:
             sys.exit("ERROR: PyYAML not installed. Install with: pip install pyyaml")
-        return yaml.safe_load(text)
+        return yaml.load(data, Loader=_YLoader)
     if ext == ".json":
-        return json.loads(text)
+        return json_loads(data)
 
     # Try JSON first, then YAML as a fallback
     try:
-        return json.loads(text)
+        return json_loads(data)
     except Exception:
         if not HAVE_YAML:
             sys.exit("ERROR: Could not parse as JSON. For YAML support: pip install pyyaml")
-        return yaml.safe_load(text)
+        return yaml.load(data, Loader=_YLoader)
 
 
 def unescape_token(tok: str) -> str: